@@ -9,6 +9,13 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from notification_hub.providers.jira import JiraProvider
 from notification_hub.providers.slack import SlackProvider
 from notification_hub.utils.jira_utils import format_description, map_status
+from notification_hub.utils.upload_utils import DEFAULT_CHUNK_SIZE
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
 
 def setup_jira_provider(args):
     server = args.server
@@ -98,6 +105,14 @@ def main():
     parser_transition.add_argument("--id", help="Transition ID")
     parser_transition.add_argument("--status", help="Target Status Name")
 
+    # Jira: attach
+    parser_attach = jira_subparsers.add_parser("attach", help="Attach file to issue")
+    parser_attach.add_argument("--key", required=True)
+    parser_attach.add_argument("--file", required=True, help="File path, or '-' to read from stdin")
+    parser_attach.add_argument("--filename", help="Attachment name (defaults to the file name)")
+    parser_attach.add_argument("--gzip", action="store_true", help="Compress the file on the fly")
+    parser_attach.add_argument("--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE, help="Bytes read at a time")
+
     # Jira: map-status
     parser_map = jira_subparsers.add_parser("map-status", help="Map internal status")
     parser_map.add_argument("--status", required=True)
@@ -127,6 +142,17 @@ def main():
     parser_send.add_argument("--channel", required=True, help="Channel ID or name")
     parser_send.add_argument("--message", required=True, help="Message text")
 
+    # Slack: upload
+    parser_upload = slack_subparsers.add_parser("upload", help="Upload file")
+    parser_upload.add_argument("--channel", required=True, help="Channel ID")
+    parser_upload.add_argument("--file", required=True, help="File path, or '-' to read from stdin")
+    parser_upload.add_argument("--filename", help="File name in Slack (defaults to the file name)")
+    parser_upload.add_argument("--title", help="File title")
+    parser_upload.add_argument("--comment", help="Message posted with the file")
+    parser_upload.add_argument("--thread-ts", help="Parent message timestamp to reply in a thread")
+    parser_upload.add_argument("--gzip", action="store_true", help="Compress the file on the fly")
+    parser_upload.add_argument("--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE, help="Bytes read at a time")
+
 
     try:
         args = parser.parse_args()
@@ -209,6 +235,17 @@ def main():
                 else:
                      raise Exception("Either --id or --status must be provided")
 
+            elif args.command == "attach":
+                source = sys.stdin.buffer if args.file == "-" else args.file
+                res = provider.add_attachment(
+                    args.key,
+                    source,
+                    filename=args.filename,
+                    compress=args.gzip,
+                    chunk_size=args.chunk_size
+                )
+                result = {"status": "success", "key": args.key, "attachment": res}
+
             elif args.command == "find-transition":
                 t_id = provider.get_transition_id_for_status(args.key, args.status)
                 result = {"transition_id": t_id}
@@ -226,6 +263,20 @@ def main():
                 )
                 result = {"status": "success", "response": res}
 
+            elif args.command == "upload":
+                source = sys.stdin.buffer if args.file == "-" else args.file
+                res = provider.upload_file(
+                    channel=args.channel,
+                    source=source,
+                    filename=args.filename,
+                    title=args.title,
+                    initial_comment=args.comment,
+                    thread_ts=args.thread_ts,
+                    compress=args.gzip,
+                    chunk_size=args.chunk_size
+                )
+                result = {"status": "success", "response": res}
+
         print(json.dumps(result))
 
     except Exception as e:
@@ -1,6 +1,11 @@
 from .core.abstract_provider import AbstractProvider
+from .core.resilience import (AdaptiveTimeout, CallTimeoutError, CircuitBreaker, CircuitOpenError,
+                              ResiliencePolicy)
 from .providers.slack import SlackProvider
 from .providers.jira import JiraProvider
 from .factory import NotificationFactory
 
-__all__ = ["AbstractProvider", "SlackProvider", "JiraProvider", "NotificationFactory"]
+__all__ = [
+    "AbstractProvider", "SlackProvider", "JiraProvider", "NotificationFactory",
+    "AdaptiveTimeout", "CircuitBreaker", "ResiliencePolicy", "CircuitOpenError", "CallTimeoutError",
+]
@@ -0,0 +1,334 @@
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, NamedTuple, Optional
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised when a call is rejected because the circuit breaker is open.
+    """
+    pass
+
+
+class CallTimeoutError(TimeoutError):
+    """
+    Raised when a call does not complete within its adaptive timeout.
+    """
+    pass
+
+
+class AdaptiveTimeout:
+    """
+    Per-endpoint timeouts derived from the latency percentiles observed for each endpoint.
+    """
+
+    def __init__(self, default: float = 5.0, minimum: float = 0.5, maximum: float = 30.0,
+                 percentile: float = 99.0, multiplier: float = 2.0, window: int = 200,
+                 min_samples: int = 20):
+        """
+        Initialize the adaptive timeout.
+
+        Args:
+            default (float): Timeout used until an endpoint has `min_samples` observations.
+            minimum (float): Lower bound of the computed timeout, in seconds.
+            maximum (float): Upper bound of the computed timeout, in seconds.
+            percentile (float): Latency percentile the timeout is derived from.
+            multiplier (float): Factor applied to the observed percentile.
+            window (int): Number of most recent latencies kept per endpoint.
+            min_samples (int): Observations needed before the timeout adapts.
+        """
+        self.default = default
+        self.minimum = minimum
+        self.maximum = maximum
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """
+        Record the latency of a successful call to `endpoint`.
+        """
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def percentile_for(self, endpoint: str, percentile: float) -> Optional[float]:
+        """
+        Get the observed latency percentile for `endpoint`, or None if there are too few samples.
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if len(samples) < self.min_samples:
+            return None
+        rank = max(0, math.ceil(percentile / 100.0 * len(samples)) - 1)
+        return samples[rank]
+
+    def timeout_for(self, endpoint: str) -> float:
+        """
+        Get the current timeout for `endpoint`.
+        """
+        observed = self.percentile_for(endpoint, self.percentile)
+        if observed is None:
+            return self.default
+        return min(self.maximum, max(self.minimum, observed * self.multiplier))
+
+
+class CallPermit(NamedTuple):
+    """
+    Admission of a call by a circuit breaker, passed back when recording its outcome.
+    """
+    trial: bool
+    generation: int
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that fails fast after repeated failures and probes recovery with half-open trials.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit.
+            recovery_timeout (float): Seconds the circuit stays open before allowing trials.
+            half_open_max_calls (int): Trial calls allowed while half-open.
+            clock (Callable): Monotonic clock, in seconds.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        The current state: 'closed', 'open' or 'half_open'.
+        """
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._trials = 0
+            self._generation += 1
+        return self._state
+
+    def _is_current_trial(self, permit: Optional[CallPermit]) -> bool:
+        return permit is not None and permit.trial and permit.generation == self._generation
+
+    def allow_request(self) -> Optional[CallPermit]:
+        """
+        Check whether a call may proceed, reserving a trial slot when half-open.
+
+        Returns:
+            Optional[CallPermit]: The permit to pass when recording the call's outcome,
+                                  or None if the call is rejected.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return CallPermit(trial=False, generation=self._generation)
+            if state == self.HALF_OPEN and self._trials < self.half_open_max_calls:
+                self._trials += 1
+                return CallPermit(trial=True, generation=self._generation)
+            return None
+
+    def record_success(self, permit: Optional[CallPermit] = None) -> None:
+        """
+        Record a successful call.
+
+        A success while closed resets the failure count. Only a trial admitted during the
+        current half-open period closes the circuit; late results of other calls are ignored.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.HALF_OPEN and self._is_current_trial(permit):
+                self._state = self.CLOSED
+                self._failures = 0
+            elif state == self.CLOSED:
+                self._failures = 0
+
+    def record_ignored(self, permit: Optional[CallPermit] = None) -> None:
+        """
+        Record a call whose outcome says nothing about the server's health (e.g. a client error).
+
+        The state is left unchanged; a half-open trial slot is released for another probe.
+        """
+        with self._lock:
+            if self._current_state() == self.HALF_OPEN and self._is_current_trial(permit) and self._trials > 0:
+                self._trials -= 1
+
+    def record_failure(self, permit: Optional[CallPermit] = None) -> None:
+        """
+        Record a failed call.
+
+        Failures while closed open the circuit once the threshold is reached, and a failed
+        trial reopens a half-open circuit. Late results of other calls are ignored.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.OPEN or (state == self.HALF_OPEN and not self._is_current_trial(permit)):
+                return
+            self._failures += 1
+            if state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._failures = 0
+
+
+class ResiliencePolicy:
+    """
+    Adaptive timeouts, a circuit breaker and hedged requests applied to provider calls.
+
+    Every call goes through the circuit breaker. Idempotent calls additionally run on a
+    bounded worker pool, so callers stop waiting once the adaptive timeout expires and a
+    hedged request can be sent when the first one is slow. Other calls run in the caller's
+    thread, bounded by the client's own timeout, so a call is never reported as failed
+    while it may still take effect.
+    """
+
+    def __init__(self, timeouts: Optional[AdaptiveTimeout] = None, breaker: Optional[CircuitBreaker] = None,
+                 hedge_percentile: float = 95.0, max_workers: int = 10,
+                 is_failure: Optional[Callable[[BaseException], bool]] = None):
+        """
+        Initialize the policy.
+
+        Args:
+            timeouts (AdaptiveTimeout): Per-endpoint timeout tracker.
+            breaker (CircuitBreaker): Circuit breaker shared by all endpoints.
+            hedge_percentile (float): Latency percentile after which a hedged request is sent.
+            max_workers (int): Maximum number of concurrent idempotent calls.
+            is_failure (Callable): Tells whether an exception indicates an unhealthy server.
+                                   Defaults to counting every exception.
+        """
+        self.timeouts = timeouts or AdaptiveTimeout()
+        self.breaker = breaker or CircuitBreaker()
+        self.hedge_percentile = hedge_percentile
+        self.max_workers = max_workers
+        self.is_failure = is_failure or (lambda error: True)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def call(self, endpoint: str, func: Callable[..., Any], *args, idempotent: bool = False,
+             **kwargs) -> Any:
+        """
+        Call `func(*args, **kwargs)` under the policy.
+
+        Args:
+            endpoint (str): Name used to track latency for the call.
+            func (Callable): The provider call.
+            idempotent (bool): Whether the call can safely be abandoned or repeated. Only
+                               idempotent calls get the adaptive timeout and hedged requests.
+
+        Returns:
+            Any: The result of the first successful call.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            CallTimeoutError: If an idempotent call does not complete within the adaptive timeout.
+        """
+        permit = self.breaker.allow_request()
+        if permit is None:
+            raise CircuitOpenError(f"Circuit open, rejecting call to '{endpoint}'")
+
+        started = time.monotonic()
+        try:
+            if idempotent:
+                hedge_delay = self.timeouts.percentile_for(endpoint, self.hedge_percentile)
+                result = self._run(endpoint, func, args, kwargs, self.timeouts.timeout_for(endpoint), hedge_delay)
+            else:
+                result = func(*args, **kwargs)
+        except Exception as e:
+            if isinstance(e, CallTimeoutError) or self.is_failure(e):
+                self.breaker.record_failure(permit)
+            else:
+                self.breaker.record_ignored(permit)
+            raise
+        except BaseException:
+            # KeyboardInterrupt, SystemExit, green-thread timeouts: release a half-open trial slot
+            self.breaker.record_ignored(permit)
+            raise
+
+        if idempotent:
+            self.timeouts.record(endpoint, time.monotonic() - started)
+        self.breaker.record_success(permit)
+        return result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="notification-hub")
+            return self._executor
+
+    def _run(self, endpoint: str, func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any],
+             timeout: float, hedge_delay: Optional[float]) -> Any:
+        executor = self._get_executor()
+        deadline = time.monotonic() + timeout
+        futures = [executor.submit(func, *args, **kwargs)]
+        if hedge_delay is not None and hedge_delay < timeout:
+            done, _ = wait(futures, timeout=hedge_delay)
+            if not done:
+                futures.append(executor.submit(func, *args, **kwargs))
+
+        pending = set(futures)
+        error: Optional[BaseException] = None
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    _cancel(pending)
+                    return future.result()
+
+        if not pending and error is not None:
+            raise error
+        _cancel(pending)
+        raise CallTimeoutError(f"Call to '{endpoint}' did not complete within {timeout:.2f}s")
+
+
+def _cancel(futures: Iterable[Future]) -> None:
+    for future in futures:
+        future.cancel()
+
+
+_shared_breakers: Dict[str, CircuitBreaker] = {}
+_shared_breakers_lock = threading.Lock()
+
+
+def get_shared_breaker(key: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker registered under `key`, creating it on first use.
+
+    Providers pointing at the same server share a breaker, while each keeps its own timeouts.
+    """
+    with _shared_breakers_lock:
+        breaker = _shared_breakers.get(key)
+        if breaker is None:
+            breaker = _shared_breakers[key] = CircuitBreaker()
+        return breaker
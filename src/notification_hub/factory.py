@@ -23,13 +23,24 @@ class NotificationFactory:
         Raises:
             ValueError: If the provider type is unsupported.
         """
+        # Only forward the timeout when given, so each provider keeps its own default
+        options = {"timeout": kwargs["timeout"]} if kwargs.get("timeout") is not None else {}
+
         if provider_type.lower() == "slack":
-            return SlackProvider(token=kwargs.get("token"))
+            return SlackProvider(
+                token=kwargs.get("token"),
+                breaker=kwargs.get("breaker"),
+                fallback=kwargs.get("fallback"),
+                **options
+            )
         elif provider_type.lower() == "jira":
             return JiraProvider(
                 server=kwargs.get("server"),
                 email=kwargs.get("email"),
-                token=kwargs.get("token")
+                token=kwargs.get("token"),
+                breaker=kwargs.get("breaker"),
+                fallback=kwargs.get("fallback"),
+                **options
             )
         else:
             raise ValueError(f"Unsupported provider type: {provider_type}")
@@ -1,13 +1,28 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from jira import JIRA, JIRAError
+from requests.exceptions import RequestException
 from ..core.abstract_provider import AbstractProvider
+from ..core.resilience import (AdaptiveTimeout, CircuitBreaker, CircuitOpenError, ResiliencePolicy,
+                               get_shared_breaker)
+from ..utils.upload_utils import DEFAULT_CHUNK_SIZE, AttachmentSource, open_attachment
+
+def _is_jira_outage(error: BaseException) -> bool:
+    """
+    Tell whether an error means the Jira server is unhealthy, as opposed to a bad request.
+    """
+    if isinstance(error, JIRAError):
+        return error.status_code is None or error.status_code >= 500
+    return isinstance(error, (RequestException, OSError))
+
 
 class JiraProvider(AbstractProvider):
     """
     Provider for interacting with Jira.
     """
 
-    def __init__(self, server: str, email: str, token: str, auth_method: str = 'basic'):
+    def __init__(self, server: str, email: str, token: str, auth_method: str = 'basic',
+                 timeout: float = 5, breaker: Optional[CircuitBreaker] = None,
+                 fallback: Optional[AbstractProvider] = None):
         """
         Initialize the Jira provider.
 
@@ -16,19 +31,31 @@ class JiraProvider(AbstractProvider):
             email (str): The email address (for basic auth).
             token (str): The API token or PAT.
             auth_method (str): 'basic' or 'token'.
+            timeout (float): Connection/read timeout of the underlying HTTP calls, in seconds.
+                             Also the default and upper bound of the adaptive timeouts.
+            breaker (CircuitBreaker): Circuit breaker guarding the calls. Defaults to a breaker
+                                      shared by all providers for `server`.
+            fallback (AbstractProvider): Provider that receives the same `send_notification`
+                                         arguments while the circuit breaker is open.
         """
         if auth_method == 'token':
             self.client = JIRA(
                 server=server,
                 token_auth=token,
-                timeout=5
+                timeout=timeout
             )
         else:
             self.client = JIRA(
                 server=server,
                 basic_auth=(email, token),
-                timeout=5
+                timeout=timeout
             )
+        self.resilience = ResiliencePolicy(
+            timeouts=AdaptiveTimeout(default=timeout, maximum=timeout),
+            breaker=breaker or get_shared_breaker(f"jira:{server}"),
+            is_failure=_is_jira_outage
+        )
+        self.fallback = fallback
 
     def send_notification(self, destination: str, message: str, **kwargs) -> Dict[str, Any]:
         """
@@ -43,6 +70,8 @@ class JiraProvider(AbstractProvider):
 
         Returns:
             Dict[str, Any]: A dictionary containing key, id, and self link of the created issue.
+                            If the circuit breaker is open and a fallback provider is configured,
+                            the fallback's response to the same arguments is returned instead.
         """
         issue_dict = {
             'project': {'key': destination},
@@ -55,12 +84,16 @@ class JiraProvider(AbstractProvider):
         # Be careful with this as JIRA structure is nested
         
         try:
-            new_issue = self.client.create_issue(fields=issue_dict)
+            new_issue = self.resilience.call("create_issue", self.client.create_issue, fields=issue_dict)
             return {
                 "key": new_issue.key,
                 "id": new_issue.id,
                 "self": new_issue.self
             }
+        except CircuitOpenError:
+            if self.fallback is None:
+                raise
+            return self.fallback.send_notification(destination, message, **kwargs)
         except JIRAError as e:
             raise e
 
@@ -75,8 +108,8 @@ class JiraProvider(AbstractProvider):
         Update an existing Jira issue.
         """
         try:
-            issue = self.client.issue(key)
-            issue.update(fields=fields)
+            issue = self.resilience.call("issue", self.client.issue, key, idempotent=True)
+            self.resilience.call("update_issue", issue.update, fields=fields)
         except JIRAError as e:
             raise e
 
@@ -85,8 +118,8 @@ class JiraProvider(AbstractProvider):
         Delete a Jira issue.
         """
         try:
-            issue = self.client.issue(key)
-            issue.delete()
+            issue = self.resilience.call("issue", self.client.issue, key, idempotent=True)
+            self.resilience.call("delete_issue", issue.delete)
         except JIRAError as e:
             raise e
 
@@ -95,7 +128,7 @@ class JiraProvider(AbstractProvider):
         Transition a Jira issue to a new status.
         """
         try:
-            self.client.transition_issue(key, transition_id)
+            self.resilience.call("transition_issue", self.client.transition_issue, key, transition_id)
         except JIRAError as e:
             raise e
 
@@ -104,10 +137,43 @@ class JiraProvider(AbstractProvider):
         Get the transition ID for a given status name.
         """
         try:
-            transitions = self.client.transitions(key)
+            transitions = self.resilience.call("transitions", self.client.transitions, key, idempotent=True)
             for t in transitions:
                 if t['to']['name'].lower() == status_name.lower():
                     return t['id']
             return None
         except JIRAError as e:
             raise e
+
+    def add_attachment(self, key: str, source: AttachmentSource, filename: Optional[str] = None,
+                       compress: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+        """
+        Attach a file to a Jira issue, streaming its content instead of loading it into memory.
+
+        Args:
+            key (str): The issue key (e.g., "PROJ-123").
+            source: A file path, binary file object or memory-mapped file.
+            filename (str): Name of the attachment. Defaults to the source's name.
+            compress (bool): Gzip the content on the fly before uploading.
+            chunk_size (int): Number of bytes read at a time while compressing or spooling.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing id, filename, size and self link of the attachment.
+        """
+        try:
+            with open_attachment(source, filename=filename, compress=compress, chunk_size=chunk_size) as attachment:
+                result = self.resilience.call(
+                    "add_attachment",
+                    self.client.add_attachment,
+                    issue=key,
+                    attachment=attachment.stream,
+                    filename=attachment.filename
+                )
+            return {
+                "id": result.id,
+                "filename": result.filename,
+                "size": result.size,
+                "self": result.self
+            }
+        except JIRAError as e:
+            raise e
@@ -1,21 +1,55 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+from urllib.error import HTTPError, URLError
+from urllib.request import HTTPSHandler, ProxyHandler, Request, build_opener
 from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
+from slack_sdk.errors import SlackApiError, SlackRequestError
 from ..core.abstract_provider import AbstractProvider
+from ..core.resilience import (AdaptiveTimeout, CircuitBreaker, CircuitOpenError, ResiliencePolicy,
+                               get_shared_breaker)
+from ..utils.upload_utils import DEFAULT_CHUNK_SIZE, AttachmentSource, iter_chunks, open_attachment
+
+def _is_slack_outage(error: BaseException) -> bool:
+    """
+    Tell whether an error means Slack is unhealthy, as opposed to a bad request.
+    """
+    if isinstance(error, SlackApiError):
+        status_code = getattr(error.response, "status_code", None)
+        return isinstance(status_code, int) and status_code >= 500
+    if isinstance(error, SlackRequestError):
+        # Raised by `_send_file_content` on top of the underlying HTTP or network error
+        cause = error.__cause__
+        if isinstance(cause, HTTPError):
+            return cause.code >= 500
+        return isinstance(cause, OSError)
+    return isinstance(error, OSError)
+
 
 class SlackProvider(AbstractProvider):
     """
     Provider for sending notifications via Slack.
     """
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, timeout: int = 30, breaker: Optional[CircuitBreaker] = None,
+                 fallback: Optional[AbstractProvider] = None):
         """
         Initialize the Slack provider.
 
         Args:
             token (str): The Slack Bot User OAuth Token.
+            timeout (int): Timeout of the underlying HTTP calls, in seconds.
+                           Also the default and upper bound of the adaptive timeouts.
+            breaker (CircuitBreaker): Circuit breaker guarding the calls. Defaults to a breaker
+                                      shared by all Slack providers.
+            fallback (AbstractProvider): Provider that receives the same `send_notification`
+                                         arguments while the circuit breaker is open.
         """
-        self.client = WebClient(token=token)
+        self.client = WebClient(token=token, timeout=timeout)
+        self.resilience = ResiliencePolicy(
+            timeouts=AdaptiveTimeout(default=timeout, maximum=timeout),
+            breaker=breaker or get_shared_breaker("slack"),
+            is_failure=_is_slack_outage
+        )
+        self.fallback = fallback
 
     def send_notification(self, destination: str, message: str, **kwargs) -> Dict[str, Any]:
         """
@@ -27,18 +61,106 @@ class SlackProvider(AbstractProvider):
             **kwargs: Additional arguments to pass to `chat_postMessage`.
 
         Returns:
-            Dict[str, Any]: The API response.
+            Dict[str, Any]: The API response. If the circuit breaker is open and a fallback
+                            provider is configured, the fallback's response to the same
+                            arguments is returned instead.
 
         Raises:
             SlackApiError: If the request fails.
+            CircuitOpenError: If the circuit breaker is open and no fallback is configured.
         """
         try:
-            response = self.client.chat_postMessage(
+            response = self.resilience.call(
+                "chat.postMessage",
+                self.client.chat_postMessage,
                 channel=destination,
                 text=message,
                 **kwargs
             )
             return response.data
+        except CircuitOpenError:
+            if self.fallback is None:
+                raise
+            return self.fallback.send_notification(destination, message, **kwargs)
         except SlackApiError as e:
             # You might want to wrap or log this error differently in a real app
             raise e
+
+    def upload_file(self, channel: str, source: AttachmentSource, filename: Optional[str] = None,
+                    title: Optional[str] = None, initial_comment: Optional[str] = None,
+                    thread_ts: Optional[str] = None, compress: bool = False,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+        """
+        Upload a file to a Slack channel, streaming its content in chunks.
+
+        Uses the `files.getUploadURLExternal` / `files.completeUploadExternal` flow so
+        memory use stays constant regardless of the file size.
+
+        Args:
+            channel (str): The channel ID to share the file in.
+            source: A file path, binary file object or memory-mapped file.
+            filename (str): Name of the file in Slack. Defaults to the source's name.
+            title (str): Title of the file. Defaults to the filename.
+            initial_comment (str): Message posted along with the file.
+            thread_ts (str): Timestamp of a parent message to upload the file as a reply.
+            compress (bool): Gzip the content on the fly before uploading.
+            chunk_size (int): Number of bytes read and sent at a time.
+
+        Returns:
+            Dict[str, Any]: The `files.completeUploadExternal` response.
+
+        Raises:
+            SlackApiError: If a Slack API call fails.
+            SlackRequestError: If sending the file content fails.
+            CircuitOpenError: If the circuit breaker is open.
+        """
+        try:
+            with open_attachment(source, filename=filename, compress=compress, chunk_size=chunk_size) as attachment:
+                upload = self.resilience.call(
+                    "files.getUploadURLExternal",
+                    self.client.files_getUploadURLExternal,
+                    filename=attachment.filename,
+                    length=attachment.length
+                )
+                self.resilience.call(
+                    "upload",
+                    self._send_file_content,
+                    upload["upload_url"],
+                    attachment.stream,
+                    attachment.length,
+                    chunk_size
+                )
+                response = self.resilience.call(
+                    "files.completeUploadExternal",
+                    self.client.files_completeUploadExternal,
+                    files=[{"id": upload["file_id"], "title": title or attachment.filename}],
+                    channel_id=channel,
+                    initial_comment=initial_comment,
+                    thread_ts=thread_ts
+                )
+                return response.data
+        except SlackApiError as e:
+            raise e
+
+    def _send_file_content(self, url: str, stream: Any, length: int, chunk_size: int) -> None:
+        """
+        POST the content of `stream` to a Slack upload URL without buffering it.
+        """
+        handlers = [HTTPSHandler(context=self.client.ssl)]
+        if self.client.proxy:
+            handlers.append(ProxyHandler({"http": self.client.proxy, "https": self.client.proxy}))
+        request = Request(
+            url,
+            data=iter_chunks(stream, chunk_size),
+            headers={"Content-Length": str(length), "Content-Type": "application/octet-stream"},
+            method="POST"
+        )
+        try:
+            with build_opener(*handlers).open(request, timeout=self.client.timeout) as resp:
+                status = resp.status
+        except HTTPError as e:
+            raise SlackRequestError(f"Failed to upload file content (status: {e.code})") from e
+        except URLError as e:
+            raise SlackRequestError(f"Failed to upload file content: {e}") from e
+        if status != 200:
+            raise SlackRequestError(f"Failed to upload file content (status: {status})")
@@ -0,0 +1,155 @@
+import gzip
+import io
+import mmap
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, NamedTuple, Optional, Union
+
+# Size of each chunk read from an attachment while uploading or compressing.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+AttachmentSource = Union[str, "os.PathLike[str]", IO[bytes], mmap.mmap]
+
+
+class AttachmentStream(NamedTuple):
+    """
+    A seekable binary stream ready to be uploaded, with its final name and size.
+    """
+    stream: Any
+    filename: str
+    length: int
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be a positive number of bytes, got {chunk_size}.")
+
+
+def iter_chunks(stream: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the remaining content of a binary stream in chunks of at most `chunk_size` bytes.
+
+    Raises:
+        ValueError: If `chunk_size` is not positive.
+    """
+    _check_chunk_size(chunk_size)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+class _MappedFile(io.RawIOBase):
+    """
+    Read-only file view over a memory-mapped file.
+
+    `mmap` objects report their full size through `len()` whatever the current
+    position, which makes HTTP clients that measure the remaining body loop forever.
+    This view behaves like a regular binary file instead.
+    """
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+
+    @property
+    def len(self) -> int:
+        return len(self._mapped)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._mapped.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._mapped.seek(offset, whence)
+        return self._mapped.tell()
+
+    def tell(self) -> int:
+        return self._mapped.tell()
+
+
+def _is_seekable(stream: Any) -> bool:
+    try:
+        return bool(stream.seekable())
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+@contextmanager
+def open_attachment(source: AttachmentSource, filename: Optional[str] = None,
+                    compress: bool = False,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[AttachmentStream]:
+    """
+    Prepare a file path, binary file object or memory-mapped file for a streamed upload.
+
+    The content is never loaded into memory as a whole. Seekable sources are streamed
+    from the beginning as they are; non-seekable sources (pipes, stdin) and compressed
+    output are spooled to a temporary file in `chunk_size` pieces so the final length
+    is known before the upload starts.
+
+    Args:
+        source: A path, a binary file object or an `mmap.mmap` instance.
+        filename (str): Name of the uploaded file. Defaults to the basename of the path
+                        or of the file object's `name` attribute.
+        compress (bool): Gzip the content on the fly and append `.gz` to the filename.
+        chunk_size (int): Number of bytes read at a time.
+
+    Yields:
+        AttachmentStream: The stream positioned at its start, its filename and length.
+
+    Raises:
+        ValueError: If no filename is given and none can be derived from the source,
+                    or if `chunk_size` is not positive.
+    """
+    _check_chunk_size(chunk_size)
+    opened = None
+    spooled = None
+    try:
+        if isinstance(source, (str, os.PathLike)):
+            opened = open(source, "rb")
+            stream = opened
+        elif isinstance(source, mmap.mmap):
+            stream = _MappedFile(source)
+        else:
+            stream = source
+
+        name = filename
+        if not name:
+            source_name = getattr(stream, "name", None)
+            if isinstance(source_name, str) and not source_name.startswith("<"):
+                name = os.path.basename(source_name)
+        if not name:
+            raise ValueError("A filename is required when uploading from an unnamed stream.")
+
+        seekable = _is_seekable(stream)
+        if seekable:
+            stream.seek(0)
+
+        if compress or not seekable:
+            spooled = tempfile.TemporaryFile()
+            if compress:
+                with gzip.GzipFile(filename=name, mode="wb", fileobj=spooled) as gz:
+                    shutil.copyfileobj(stream, gz, chunk_size)
+                name = f"{name}.gz"
+            else:
+                shutil.copyfileobj(stream, spooled, chunk_size)
+            stream = spooled
+
+        stream.seek(0, os.SEEK_END)
+        length = stream.tell()
+        stream.seek(0)
+        yield AttachmentStream(stream=stream, filename=name, length=length)
+    finally:
+        if spooled is not None:
+            spooled.close()
+        if opened is not None:
+            opened.close()
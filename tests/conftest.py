@@ -7,3 +7,8 @@ def mock_slack_client(mocker):
 @pytest.fixture
 def mock_jira_client(mocker):
     return mocker.patch("notification_hub.providers.jira.JIRA")
+
+@pytest.fixture(autouse=True)
+def isolated_circuit_breakers(mocker):
+    # Providers share circuit breakers per server; keep breaker state from leaking between tests
+    mocker.patch.dict("notification_hub.core.resilience._shared_breakers", clear=True)
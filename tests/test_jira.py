@@ -1,5 +1,11 @@
+import io
+import mmap
+import time
+
 import pytest
 from jira import JIRAError
+from notification_hub.core.resilience import CircuitBreaker
+from notification_hub.factory import NotificationFactory
 from notification_hub.providers.jira import JiraProvider
 
 def test_jira_send_notification_success(mock_jira_client):
@@ -53,3 +59,90 @@ def test_jira_send_notification_failure(mock_jira_client):
 
     with pytest.raises(JIRAError):
         provider.send_notification(destination="PROJ", message="Fail")
+
+def test_jira_add_attachment_from_mmap(mock_jira_client, tmp_path):
+    mock_instance = mock_jira_client.return_value
+    uploaded = {}
+
+    def fake_add_attachment(issue, attachment, filename):
+        uploaded["content"] = attachment.read()
+        result = mock_instance.add_attachment.return_value
+        result.id, result.filename, result.size, result.self = "200", filename, len(uploaded["content"]), "http://jira/attachment/200"
+        return result
+
+    mock_instance.add_attachment.side_effect = fake_add_attachment
+
+    diff_file = tmp_path / "release.diff"
+    diff_file.write_bytes(b"+added line\n" * 50)
+
+    provider = JiraProvider(server="http://jira", email="user", token="token")
+    with open(diff_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        result = provider.add_attachment("PROJ-123", mapped, filename="release.diff")
+
+    assert mock_instance.add_attachment.call_args[1]["issue"] == "PROJ-123"
+    assert uploaded["content"] == b"+added line\n" * 50
+    assert result == {"id": "200", "filename": "release.diff", "size": 600, "self": "http://jira/attachment/200"}
+
+def test_jira_add_attachment_requires_filename_for_unnamed_stream(mock_jira_client):
+    provider = JiraProvider(server="http://jira", email="user", token="token")
+
+    with pytest.raises(ValueError):
+        provider.add_attachment("PROJ-123", io.BytesIO(b"data"))
+
+def test_jira_circuit_open_diverts_to_fallback(mock_jira_client, mocker):
+    mock_instance = mock_jira_client.return_value
+    mock_instance.create_issue.side_effect = JIRAError(status_code=503, text="Service Unavailable")
+    fallback = mocker.Mock()
+    fallback.send_notification.return_value = {"queued": True}
+
+    provider = JiraProvider(server="http://jira", email="user", token="token",
+                            breaker=CircuitBreaker(failure_threshold=1), fallback=fallback)
+
+    with pytest.raises(JIRAError):
+        provider.send_notification(destination="PROJ", message="Outage")
+    result = provider.send_notification(destination="PROJ", message="Outage")
+
+    assert mock_instance.create_issue.call_count == 1
+    fallback.send_notification.assert_called_once_with("PROJ", "Outage")
+    assert result == {"queued": True}
+
+def test_jira_client_errors_do_not_open_circuit(mock_jira_client):
+    mock_instance = mock_jira_client.return_value
+    mock_instance.transitions.side_effect = JIRAError(status_code=404, text="Issue Does Not Exist")
+
+    provider = JiraProvider(server="http://jira", email="user", token="token")
+    for _ in range(10):
+        with pytest.raises(JIRAError):
+            provider.get_transition_id_for_status("PROJ-404", "Done")
+
+    assert provider.resilience.breaker.state == CircuitBreaker.CLOSED
+
+def test_jira_providers_share_breaker_but_keep_their_timeouts(mock_jira_client):
+    short = JiraProvider(server="http://jira", email="user", token="token", timeout=5)
+    long = JiraProvider(server="http://jira", email="user", token="token", timeout=60)
+
+    assert short.resilience.breaker is long.resilience.breaker
+    assert short.resilience.timeouts.timeout_for("transitions") == 5
+    assert long.resilience.timeouts.timeout_for("transitions") == 60
+
+def test_jira_writes_are_not_abandoned_on_adaptive_timeout(mock_jira_client):
+    mock_instance = mock_jira_client.return_value
+    mock_issue = mock_instance.create_issue.return_value
+    mock_issue.key, mock_issue.id, mock_issue.self = "PROJ-1", "1", "http://jira/issue/1"
+
+    provider = JiraProvider(server="http://jira", email="user", token="token")
+    provider.resilience.timeouts.default = 0.0001
+    mock_instance.create_issue.side_effect = lambda fields: time.sleep(0.05) or mock_issue
+
+    assert provider.create_issue("PROJ", "Summary", "Description")["key"] == "PROJ-1"
+
+def test_factory_forwards_jira_timeout(mock_jira_client):
+    provider = NotificationFactory.get_provider("jira", server="http://jira", email="user", token="token", timeout=60)
+
+    assert mock_jira_client.call_args[1]["timeout"] == 60
+    assert provider.resilience.timeouts.maximum == 60
+
+def test_factory_keeps_default_jira_timeout(mock_jira_client):
+    NotificationFactory.get_provider("jira", server="http://jira", email="user", token="token")
+
+    assert mock_jira_client.call_args[1]["timeout"] == 5
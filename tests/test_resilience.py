@@ -0,0 +1,167 @@
+import threading
+import time
+
+import pytest
+from notification_hub.core.resilience import (AdaptiveTimeout, CallTimeoutError, CircuitBreaker,
+                                              CircuitOpenError, ResiliencePolicy)
+
+def test_adaptive_timeout_uses_default_until_enough_samples():
+    timeouts = AdaptiveTimeout(default=5.0, min_samples=3)
+    timeouts.record("issue", 0.1)
+    timeouts.record("issue", 0.2)
+
+    assert timeouts.timeout_for("issue") == 5.0
+
+def test_adaptive_timeout_follows_latency_percentile():
+    timeouts = AdaptiveTimeout(default=5.0, minimum=0.01, maximum=5.0, percentile=99.0, multiplier=2.0, min_samples=10)
+    for latency in [0.1] * 99 + [0.4]:
+        timeouts.record("issue", latency)
+
+    assert timeouts.percentile_for("issue", 99.0) == 0.1
+    assert timeouts.timeout_for("issue") == pytest.approx(0.2)
+    assert timeouts.timeout_for("transitions") == 5.0
+
+def test_adaptive_timeout_is_clamped():
+    timeouts = AdaptiveTimeout(default=5.0, minimum=0.5, maximum=2.0, min_samples=1)
+    timeouts.record("fast", 0.01)
+    timeouts.record("slow", 10.0)
+
+    assert timeouts.timeout_for("fast") == 0.5
+    assert timeouts.timeout_for("slow") == 2.0
+
+def test_circuit_breaker_opens_and_probes_with_half_open_trial():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10.0, clock=lambda: now[0])
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is None
+
+    now[0] = 10.0
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    trial = breaker.allow_request()
+    assert trial.trial
+    assert breaker.allow_request() is None
+
+    breaker.record_failure(trial)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    now[0] = 20.0
+    trial = breaker.allow_request()
+    breaker.record_success(trial)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_policy_fails_fast_once_circuit_is_open():
+    policy = ResiliencePolicy(breaker=CircuitBreaker(failure_threshold=1))
+    calls = []
+
+    def failing():
+        calls.append(1)
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        policy.call("issue", failing)
+    with pytest.raises(CircuitOpenError):
+        policy.call("issue", failing)
+
+    assert len(calls) == 1
+
+def test_policy_ignores_errors_that_are_not_failures():
+    policy = ResiliencePolicy(breaker=CircuitBreaker(failure_threshold=1), is_failure=lambda e: not isinstance(e, KeyError))
+
+    with pytest.raises(KeyError):
+        policy.call("issue", lambda: {}["missing"])
+
+    assert policy.breaker.state == CircuitBreaker.CLOSED
+
+def test_policy_times_out_slow_calls():
+    release = threading.Event()
+    policy = ResiliencePolicy(timeouts=AdaptiveTimeout(default=0.05), breaker=CircuitBreaker(failure_threshold=1))
+
+    started = time.monotonic()
+    with pytest.raises(CallTimeoutError):
+        policy.call("issue", release.wait, 5, idempotent=True)
+    release.set()
+
+    assert time.monotonic() - started < 1
+    assert policy.breaker.state == CircuitBreaker.OPEN
+
+def test_policy_hedges_slow_idempotent_calls():
+    # Hedge after the 10ms p95, but leave a generous overall deadline
+    timeouts = AdaptiveTimeout(default=2.0, minimum=2.0, min_samples=1)
+    timeouts.record("transitions", 0.01)
+    policy = ResiliencePolicy(timeouts=timeouts)
+    release = threading.Event()
+    attempts = []
+
+    def transitions():
+        attempts.append(1)
+        if len(attempts) == 1:
+            release.wait(5)
+            return "slow"
+        return "fast"
+
+    assert policy.call("transitions", transitions, idempotent=True) == "fast"
+    release.set()
+    assert len(attempts) == 2
+
+def test_policy_runs_non_idempotent_calls_to_completion():
+    policy = ResiliencePolicy(timeouts=AdaptiveTimeout(default=0.01))
+
+    assert policy.call("create_issue", lambda: time.sleep(0.05) or "created") == "created"
+
+def test_circuit_breaker_ignores_late_success_while_open():
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    permit = breaker.allow_request()
+    breaker.record_failure(permit)
+    breaker.record_success(permit)
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+def test_client_errors_do_not_close_half_open_circuit():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0, clock=lambda: now[0])
+    policy = ResiliencePolicy(breaker=breaker, is_failure=lambda e: not isinstance(e, KeyError))
+    breaker.record_failure()
+    now[0] = 10.0
+
+    with pytest.raises(KeyError):
+        policy.call("issue", lambda: {}["missing"])
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+
+def test_circuit_breaker_ignores_late_results_while_half_open():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0, clock=lambda: now[0])
+    late = breaker.allow_request()
+    breaker.record_failure(breaker.allow_request())
+    now[0] = 10.0
+    trial = breaker.allow_request()
+
+    breaker.record_success(late)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_failure(late)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    breaker.record_success(trial)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_interrupted_trial_releases_half_open_slot():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0, clock=lambda: now[0])
+    policy = ResiliencePolicy(breaker=breaker)
+    breaker.record_failure(breaker.allow_request())
+    now[0] = 10.0
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        policy.call("issue", interrupted)
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() is not None
@@ -1,5 +1,10 @@
+import gzip
+import io
+from urllib.error import HTTPError, URLError
+
 import pytest
-from slack_sdk.errors import SlackApiError
+from slack_sdk.errors import SlackApiError, SlackRequestError
+from notification_hub.core.resilience import CircuitBreaker, CircuitOpenError
 from notification_hub.providers.slack import SlackProvider
 
 def test_slack_send_notification_success(mock_slack_client):
@@ -27,3 +32,98 @@ def test_slack_send_notification_failure(mock_slack_client):
     
     with pytest.raises(SlackApiError):
         provider.send_notification(destination="#unknown", message="Hello")
+
+def test_slack_upload_file_streams_content(mock_slack_client, mocker, tmp_path):
+    mock_instance = mock_slack_client.return_value
+    mock_instance.proxy = None
+    mock_instance.files_getUploadURLExternal.return_value = {"upload_url": "https://files.slack.com/upload/v1/abc", "file_id": "F123"}
+    mock_instance.files_completeUploadExternal.return_value.data = {"ok": True, "files": [{"id": "F123"}]}
+    mock_opener = mocker.patch("notification_hub.providers.slack.build_opener")
+    mock_opener.return_value.open.return_value.__enter__.return_value.status = 200
+    sent = []
+    mock_opener.return_value.open.side_effect = lambda req, timeout: sent.extend(req.data) or mock_opener.return_value.open.return_value
+
+    log_file = tmp_path / "deploy.log"
+    log_file.write_bytes(b"line\n" * 1000)
+
+    provider = SlackProvider(token="fake-token")
+    result = provider.upload_file(channel="C123", source=str(log_file), chunk_size=1024)
+
+    mock_instance.files_getUploadURLExternal.assert_called_once_with(filename="deploy.log", length=5000)
+    assert b"".join(sent) == b"line\n" * 1000
+    assert max(len(chunk) for chunk in sent) == 1024
+    mock_instance.files_completeUploadExternal.assert_called_once_with(
+        files=[{"id": "F123", "title": "deploy.log"}],
+        channel_id="C123",
+        initial_comment=None,
+        thread_ts=None
+    )
+    assert result == {"ok": True, "files": [{"id": "F123"}]}
+
+def test_slack_upload_file_gzip(mock_slack_client, mocker):
+    mock_instance = mock_slack_client.return_value
+    mock_instance.proxy = None
+    mock_instance.files_getUploadURLExternal.return_value = {"upload_url": "https://files.slack.com/upload/v1/abc", "file_id": "F123"}
+    mock_opener = mocker.patch("notification_hub.providers.slack.build_opener")
+    mock_opener.return_value.open.return_value.__enter__.return_value.status = 200
+    sent = []
+    mock_opener.return_value.open.side_effect = lambda req, timeout: sent.extend(req.data) or mock_opener.return_value.open.return_value
+
+    provider = SlackProvider(token="fake-token")
+    provider.upload_file(channel="C123", source=io.BytesIO(b"diff " * 100), filename="changes.diff", compress=True)
+
+    kwargs = mock_instance.files_getUploadURLExternal.call_args[1]
+    assert kwargs["filename"] == "changes.diff.gz"
+    assert kwargs["length"] == len(b"".join(sent))
+    assert gzip.decompress(b"".join(sent)) == b"diff " * 100
+
+def test_slack_circuit_open_fails_fast_without_fallback(mock_slack_client):
+    mock_instance = mock_slack_client.return_value
+    mock_instance.chat_postMessage.side_effect = ConnectionResetError("connection reset")
+
+    provider = SlackProvider(token="fake-token", breaker=CircuitBreaker(failure_threshold=1))
+
+    with pytest.raises(ConnectionResetError):
+        provider.send_notification(destination="#general", message="Hello")
+    with pytest.raises(CircuitOpenError):
+        provider.send_notification(destination="#general", message="Hello")
+
+    assert mock_instance.chat_postMessage.call_count == 1
+
+def test_slack_upload_file_rejects_non_positive_chunk_size(mock_slack_client):
+    provider = SlackProvider(token="fake-token")
+
+    with pytest.raises(ValueError):
+        provider.upload_file(channel="C123", source=io.BytesIO(b"data"), filename="data.txt", chunk_size=0)
+
+    mock_slack_client.return_value.files_getUploadURLExternal.assert_not_called()
+
+def test_slack_upload_network_errors_count_as_outage(mock_slack_client, mocker):
+    mock_instance = mock_slack_client.return_value
+    mock_instance.proxy = None
+    mock_instance.files_getUploadURLExternal.return_value = {"upload_url": "https://files.slack.com/upload/v1/abc", "file_id": "F123"}
+    mock_opener = mocker.patch("notification_hub.providers.slack.build_opener")
+    mock_opener.return_value.open.side_effect = URLError("connection refused")
+
+    provider = SlackProvider(token="fake-token", breaker=CircuitBreaker(failure_threshold=1))
+
+    with pytest.raises(SlackRequestError):
+        provider.upload_file(channel="C123", source=io.BytesIO(b"data"), filename="data.txt")
+
+    assert provider.resilience.breaker.state == CircuitBreaker.OPEN
+
+def test_slack_upload_client_errors_do_not_open_circuit(mock_slack_client, mocker):
+    mock_instance = mock_slack_client.return_value
+    mock_instance.proxy = None
+    mock_instance.files_getUploadURLExternal.return_value = {"upload_url": "https://files.slack.com/upload/v1/abc", "file_id": "F123"}
+    mock_opener = mocker.patch("notification_hub.providers.slack.build_opener")
+    mock_opener.return_value.open.side_effect = HTTPError(
+        "https://files.slack.com/upload/v1/abc", 413, "Payload Too Large", {}, None
+    )
+
+    provider = SlackProvider(token="fake-token", breaker=CircuitBreaker(failure_threshold=1))
+
+    with pytest.raises(SlackRequestError):
+        provider.upload_file(channel="C123", source=io.BytesIO(b"data"), filename="data.txt")
+
+    assert provider.resilience.breaker.state == CircuitBreaker.CLOSED